@@ -1,7 +1,9 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException, Depends
+from fastapi import FastAPI, UploadFile, File, HTTPException, Depends, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from typing import List, Optional
+import asyncio
+import json
 import os
 from dotenv import load_dotenv
 
@@ -9,7 +11,9 @@ from app.services.supabase_service import SupabaseService
 from app.services.mongodb_service import MongoDBService
 from app.services.resume_processor import ResumeProcessor
 from app.services.qa_service import QAService
-from app.models.candidate import Candidate, CandidateSummary, QuestionRequest
+from app.services.reprocess_service import ReprocessService
+from app.services.admission_controller import AdmissionController, AdmissionRejected
+from app.models.candidate import Candidate, CandidateSummary, QuestionRequest, BatchQuestionRequest
 
 load_dotenv()
 
@@ -27,6 +31,35 @@ supabase_service = SupabaseService()
 mongodb_service = MongoDBService()
 resume_processor = ResumeProcessor()
 qa_service = QAService()
+reprocess_service = ReprocessService(mongodb_service)
+admission_controller = AdmissionController()
+ask_batch_semaphore = asyncio.Semaphore(qa_service.batch_concurrency)
+
+analytics_reconcile_interval = int(os.getenv("ANALYTICS_RECONCILE_INTERVAL", "3600"))
+
+
+async def reconcile_analytics_periodically():
+    while True:
+        try:
+            await mongodb_service.reconcile_facet_counts()
+        except Exception as e:
+            print(f"Analytics reconciliation error: {e}")
+        await asyncio.sleep(analytics_reconcile_interval)
+
+
+@app.on_event("startup")
+async def startup():
+    try:
+        await mongodb_service.ensure_indexes()
+    except Exception as e:
+        print(f"Warning: {e}")
+    app.state.analytics_task = asyncio.create_task(reconcile_analytics_periodically())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    app.state.analytics_task.cancel()
+    qa_service.executor.shutdown(wait=False)
 
 
 @app.get("/")
@@ -47,18 +80,19 @@ async def upload_resume(file: UploadFile = File(...)):
                 detail="Invalid file type. Only PDF and DOCX files are allowed."
             )
         
-        file_content = await file.read()
-        
-        supabase_metadata = await supabase_service.upload_file(
-            file_content, 
-            file.filename
-        )
-        
-        resume_text = await resume_processor.extract_text(file_content, file_ext)
-        candidate_data = await resume_processor.process_resume(resume_text)
-        
-        candidate_data["candidate_id"] = supabase_metadata["id"]
-        candidate_doc = await mongodb_service.save_candidate(candidate_data)
+        async with admission_controller.admit():
+            file_content = await file.read()
+            
+            supabase_metadata = await supabase_service.upload_file(
+                file_content, 
+                file.filename
+            )
+            
+            resume_text = await resume_processor.extract_text(file_content, file_ext)
+            candidate_data = await resume_processor.process_resume(resume_text)
+            
+            candidate_data["candidate_id"] = supabase_metadata["id"]
+            candidate_doc = await mongodb_service.save_candidate(candidate_data, resume_text=resume_text)
         
         return JSONResponse(
             status_code=200,
@@ -70,6 +104,14 @@ async def upload_resume(file: UploadFile = File(...)):
             }
         )
     
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
@@ -96,6 +138,40 @@ async def get_candidate(candidate_id: str):
         raise HTTPException(status_code=500, detail=f"Error fetching candidate: {str(e)}")
 
 
+@app.post("/ask/batch")
+async def ask_questions_batch(request: BatchQuestionRequest):
+    try:
+        candidate_ids = list(dict.fromkeys(request.candidate_ids))
+        candidates = await mongodb_service.get_candidates_by_ids(candidate_ids)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching candidates: {str(e)}")
+    
+    async def answer_row(candidate_id: str):
+        candidate = candidates.get(candidate_id)
+        if not candidate:
+            return {"candidate_id": candidate_id, "error": "Candidate not found"}
+        
+        try:
+            async with ask_batch_semaphore:
+                answers = await qa_service.answer_questions(request.questions, candidate)
+            return {"candidate_id": candidate_id, "answers": answers}
+        except Exception as e:
+            return {"candidate_id": candidate_id, "error": f"Error generating answer: {str(e)}"}
+    
+    async def stream_rows():
+        yield json.dumps({"questions": request.questions, "candidate_ids": candidate_ids}) + "\n"
+        
+        tasks = [asyncio.create_task(answer_row(candidate_id)) for candidate_id in candidate_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield json.dumps(await task) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_rows(), media_type="application/x-ndjson")
+
+
 @app.post("/ask/{candidate_id}")
 async def ask_question(candidate_id: str, question: QuestionRequest):
     try:
@@ -120,6 +196,51 @@ async def ask_question(candidate_id: str, question: QuestionRequest):
         raise HTTPException(status_code=500, detail=f"Error generating answer: {str(e)}")
 
 
+async def get_facet_response(facet: str, limit: int):
+    try:
+        counts = await mongodb_service.get_facet_counts(facet, limit)
+        return {"facet": facet, "counts": counts}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching analytics: {str(e)}")
+
+
+@app.get("/analytics/skills")
+async def get_skill_analytics(limit: int = Query(50, ge=1, le=500)):
+    return await get_facet_response("skill", limit)
+
+
+@app.get("/analytics/degrees")
+async def get_degree_analytics(limit: int = Query(50, ge=1, le=500)):
+    return await get_facet_response("degree", limit)
+
+
+@app.get("/analytics/years")
+async def get_year_analytics(limit: int = Query(50, ge=1, le=500)):
+    return await get_facet_response("year", limit)
+
+
+@app.post("/admin/reprocess")
+async def start_reprocess():
+    try:
+        status = await reprocess_service.start()
+        return JSONResponse(status_code=202, content=status)
+    
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error starting reprocessing: {str(e)}")
+
+
+@app.get("/admin/reprocess")
+async def get_reprocess_status():
+    return reprocess_service.get_status()
+
+
+@app.get("/admin/admission")
+async def get_admission_stats():
+    return admission_controller.get_stats()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
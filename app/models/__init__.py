@@ -1,6 +1,6 @@
-from .candidate import Candidate, CandidateSummary, QuestionRequest
+from .candidate import Candidate, CandidateSummary, QuestionRequest, BatchQuestionRequest
 
-__all__ = ["Candidate", "CandidateSummary", "QuestionRequest"]
+__all__ = ["Candidate", "CandidateSummary", "QuestionRequest", "BatchQuestionRequest"]
 
 
 
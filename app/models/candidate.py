@@ -43,6 +43,6 @@ class QuestionRequest(BaseModel):
     question: str = Field(..., description="Natural language question about the candidate")
 
 
-
-
-
+class BatchQuestionRequest(BaseModel):
+    questions: List[str] = Field(..., min_length=1, max_length=20, description="Questions to ask about every candidate")
+    candidate_ids: List[str] = Field(..., min_length=1, max_length=200, description="Candidates to ask the questions about")
@@ -0,0 +1,87 @@
+import asyncio
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Any
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("Server is busy, please retry later")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    def __init__(self):
+        self.max_concurrent = int(os.getenv("ADMISSION_MAX_CONCURRENT", "2"))
+        self.max_queue = int(os.getenv("ADMISSION_MAX_QUEUE", "8"))
+        self.retry_after = int(os.getenv("ADMISSION_RETRY_AFTER", "5"))
+
+        if self.max_concurrent < 1:
+            raise ValueError("ADMISSION_MAX_CONCURRENT must be at least 1")
+        if self.max_queue < 0:
+            raise ValueError("ADMISSION_MAX_QUEUE must not be negative")
+        if self.retry_after < 0:
+            raise ValueError("ADMISSION_RETRY_AFTER must not be negative")
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_queue_depth = 0
+
+    @asynccontextmanager
+    async def admit(self):
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queue_depth": len(self._waiters),
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected
+        }
+
+    async def _acquire(self):
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise AdmissionRejected(self.retry_after)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiters))
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            elif future in self._waiters:
+                self._waiters.remove(future)
+            raise
+
+        self.admitted += 1
+
+    def _release(self):
+        self._active -= 1
+
+        while self._waiters:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
+            break
@@ -0,0 +1,39 @@
+import re
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+
+FACETS = ["skill", "degree", "year"]
+
+
+def facet_values(doc: Optional[Dict[str, Any]]) -> Dict[str, Set[str]]:
+    values = {facet: set() for facet in FACETS}
+    if not doc:
+        return values
+
+    for skill in doc.get("skills") or []:
+        if isinstance(skill, str) and skill:
+            values["skill"].add(skill)
+
+    for edu in doc.get("education") or []:
+        degree = edu.get("degree")
+        if isinstance(degree, str) and degree:
+            values["degree"].add(degree)
+        end_date = edu.get("end_date")
+        if isinstance(end_date, str) and re.fullmatch(r"\d{4}", end_date):
+            values["year"].add(end_date)
+
+    return values
+
+
+def facet_deltas(diffs: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]) -> Dict[Tuple[str, str], int]:
+    deltas: Dict[Tuple[str, str], int] = {}
+    for previous_doc, new_doc in diffs:
+        old_values = facet_values(previous_doc)
+        new_values = facet_values(new_doc)
+        for facet in FACETS:
+            for value in new_values[facet] - old_values[facet]:
+                deltas[(facet, value)] = deltas.get((facet, value), 0) + 1
+            for value in old_values[facet] - new_values[facet]:
+                deltas[(facet, value)] = deltas.get((facet, value), 0) - 1
+
+    return {key: delta for key, delta in deltas.items() if delta != 0}
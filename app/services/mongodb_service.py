@@ -1,7 +1,11 @@
 import os
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import List, Optional, Dict, Any, AsyncIterator, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, ReturnDocument
 from app.models.candidate import Candidate, CandidateSummary, Education, Experience
+from app.services.resume_processor import compress_text
+from app.services.facet_counts import FACETS, facet_deltas
 
 
 class MongoDBService:
@@ -13,8 +17,9 @@ class MongoDBService:
         self.client = AsyncIOMotorClient(mongodb_url)
         self.db = self.client.get_database(os.getenv("MONGODB_DATABASE", "resume_processor"))
         self.collection = self.db.get_collection("candidates")
+        self.facet_collection = self.db.get_collection("candidate_facets")
     
-    async def save_candidate(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def save_candidate(self, candidate_data: Dict[str, Any], resume_text: Optional[str] = None) -> Dict[str, Any]:
         try:
             candidate_doc = {
                 "candidate_id": candidate_data["candidate_id"],
@@ -24,15 +29,24 @@ class MongoDBService:
                 "hobbies": candidate_data.get("hobbies", []),
                 "certifications": candidate_data.get("certifications", []),
                 "projects": candidate_data.get("projects", []),
-                "introduction": candidate_data.get("introduction", "")
+                "introduction": candidate_data.get("introduction", ""),
+                "extractor_versions": candidate_data.get("extractor_versions", {})
             }
             
-            result = await self.collection.update_one(
+            update_doc = dict(candidate_doc)
+            if resume_text is not None:
+                update_doc["resume_text_z"] = compress_text(resume_text)
+            
+            previous_doc = await self.collection.find_one_and_update(
                 {"candidate_id": candidate_doc["candidate_id"]},
-                {"$set": candidate_doc},
-                upsert=True
+                {"$set": update_doc},
+                projection={"_id": 0, "skills": 1, "education": 1},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
             )
             
+            await self._apply_facet_diffs([(previous_doc, candidate_doc)])
+            
             return candidate_doc
         
         except Exception as e:
@@ -40,28 +54,38 @@ class MongoDBService:
     
     async def get_candidate_by_id(self, candidate_id: str) -> Optional[Candidate]:
         try:
-            doc = await self.collection.find_one({"candidate_id": candidate_id})
+            doc = await self.collection.find_one(
+                {"candidate_id": candidate_id},
+                {"_id": 0, "resume_text_z": 0}
+            )
             if not doc:
                 return None
             
-            if "_id" in doc:
-                del doc["_id"]
-            
             return Candidate(**doc)
         
         except Exception as e:
             raise Exception(f"Error fetching candidate: {str(e)}")
     
+    async def get_candidates_by_ids(self, candidate_ids: List[str]) -> Dict[str, Candidate]:
+        try:
+            cursor = self.collection.find(
+                {"candidate_id": {"$in": candidate_ids}},
+                {"_id": 0, "resume_text_z": 0}
+            )
+            docs = await cursor.to_list(length=None)
+            
+            return {doc["candidate_id"]: Candidate(**doc) for doc in docs}
+        
+        except Exception as e:
+            raise Exception(f"Error fetching candidates: {str(e)}")
+    
     async def get_all_candidates_summary(self) -> List[CandidateSummary]:
         try:
-            cursor = self.collection.find({})
+            cursor = self.collection.find({}, {"_id": 0, "resume_text_z": 0})
             candidates = await cursor.to_list(length=None)
             
             summaries = []
             for doc in candidates:
-                if "_id" in doc:
-                    del doc["_id"]
-                
                 summary = CandidateSummary(
                     candidate_id=doc.get("candidate_id", ""),
                     introduction=doc.get("introduction", "")[:200],
@@ -75,3 +99,182 @@ class MongoDBService:
         
         except Exception as e:
             raise Exception(f"Error fetching candidates summary: {str(e)}")
+    
+    async def count_stale_candidates(self, current_versions: Dict[str, int]) -> int:
+        try:
+            return await self.collection.count_documents(self._stale_query(current_versions))
+        
+        except Exception as e:
+            raise Exception(f"Error counting stale candidates: {str(e)}")
+    
+    async def count_unreprocessable_candidates(self) -> int:
+        try:
+            return await self.collection.count_documents({"resume_text_z": {"$exists": False}})
+        
+        except Exception as e:
+            raise Exception(f"Error counting candidates without stored text: {str(e)}")
+    
+    async def iter_stale_candidates(
+        self,
+        current_versions: Dict[str, int],
+        batch_size: int = 100
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        try:
+            cursor = self.collection.find(
+                self._stale_query(current_versions),
+                {"_id": 0, "candidate_id": 1, "resume_text_z": 1, "extractor_versions": 1},
+                batch_size=batch_size
+            )
+            
+            batch = []
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            
+            if batch:
+                yield batch
+        
+        except Exception as e:
+            raise Exception(f"Error fetching stale candidates: {str(e)}")
+    
+    async def update_extracted_fields(
+        self,
+        updates: List[Tuple[str, Dict[str, Any]]],
+        current_versions: Dict[str, int]
+    ) -> int:
+        if not updates:
+            return 0
+        
+        try:
+            previous_docs = {}
+            if any("skills" in fields or "education" in fields for _, fields in updates):
+                cursor = self.collection.find(
+                    {"candidate_id": {"$in": [candidate_id for candidate_id, _ in updates]}},
+                    {"_id": 0, "candidate_id": 1, "skills": 1, "education": 1}
+                )
+                previous_docs = {doc["candidate_id"]: doc for doc in await cursor.to_list(length=None)}
+            
+            operations = []
+            for candidate_id, fields in updates:
+                update_doc = dict(fields)
+                for field in fields:
+                    update_doc[f"extractor_versions.{field}"] = current_versions[field]
+                operations.append(UpdateOne({"candidate_id": candidate_id}, {"$set": update_doc}))
+            
+            result = await self.collection.bulk_write(operations, ordered=False)
+            
+            diffs = []
+            for candidate_id, fields in updates:
+                previous_doc = previous_docs.get(candidate_id)
+                if previous_doc is not None:
+                    diffs.append((previous_doc, {**previous_doc, **fields}))
+            await self._apply_facet_diffs(diffs)
+            
+            return result.modified_count
+        
+        except Exception as e:
+            raise Exception(f"Error updating extracted fields: {str(e)}")
+    
+    async def ensure_indexes(self):
+        try:
+            await self.collection.create_index("candidate_id")
+            await self.facet_collection.create_index([("facet", 1), ("count", -1), ("value", 1)])
+            await self.facet_collection.create_index("generation")
+        
+        except Exception as e:
+            raise Exception(f"Error creating indexes: {str(e)}")
+    
+    async def get_facet_counts(self, facet: str, limit: int = 50) -> List[Dict[str, Any]]:
+        try:
+            cursor = self.facet_collection.find(
+                {"facet": facet, "count": {"$gt": 0}},
+                {"_id": 0, "value": 1, "count": 1}
+            ).sort([("count", -1), ("value", 1)]).limit(limit)
+            
+            return await cursor.to_list(length=None)
+        
+        except Exception as e:
+            raise Exception(f"Error fetching {facet} counts: {str(e)}")
+    
+    async def reconcile_facet_counts(self) -> int:
+        try:
+            generation = datetime.utcnow()
+            
+            def distinct_values(expression: Dict[str, Any]) -> Dict[str, Any]:
+                return {"$setUnion": [{"$filter": {"input": {"$ifNull": [expression, []]}, "cond": {
+                    "$and": [{"$eq": [{"$type": "$$this"}, "string"]}, {"$ne": ["$$this", ""]}]
+                }}}, []]}
+            
+            def count_stage(field: str) -> List[Dict[str, Any]]:
+                return [
+                    {"$unwind": f"${field}"},
+                    {"$group": {"_id": f"${field}", "count": {"$sum": 1}}}
+                ]
+            
+            pipeline = [
+                {"$project": {
+                    "skill": distinct_values("$skills"),
+                    "degree": distinct_values("$education.degree"),
+                    "year": {"$filter": {
+                        "input": distinct_values("$education.end_date"),
+                        "cond": {"$regexMatch": {"input": "$$this", "regex": r"^\d{4}$"}}
+                    }}
+                }},
+                {"$facet": {facet: count_stage(facet) for facet in FACETS}}
+            ]
+            
+            result = await self.collection.aggregate(pipeline).to_list(length=None)
+            grouped = result[0] if result else {}
+            
+            operations = [
+                UpdateOne(
+                    {"_id": f"{facet}:{row['_id']}"},
+                    {"$set": {"facet": facet, "value": row["_id"], "count": row["count"], "generation": generation}},
+                    upsert=True
+                )
+                for facet in FACETS
+                for row in grouped.get(facet, [])
+            ]
+            
+            if operations:
+                await self.facet_collection.bulk_write(operations, ordered=False)
+            await self.facet_collection.delete_many({"generation": {"$not": {"$gte": generation}}})
+            
+            return len(operations)
+        
+        except Exception as e:
+            raise Exception(f"Error reconciling facet counts: {str(e)}")
+    
+    async def _apply_facet_diffs(self, diffs: List[Tuple[Optional[Dict[str, Any]], Dict[str, Any]]]):
+        deltas = facet_deltas(diffs)
+        
+        generation = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": f"{facet}:{value}"},
+                {
+                    "$inc": {"count": delta},
+                    "$max": {"generation": generation},
+                    "$setOnInsert": {"facet": facet, "value": value}
+                },
+                upsert=True
+            )
+            for (facet, value), delta in deltas.items()
+        ]
+        
+        if operations:
+            try:
+                await self.facet_collection.bulk_write(operations, ordered=False)
+            except Exception as e:
+                print(f"Warning: Could not update facet counters: {e}. They will be fixed on the next reconciliation.")
+    
+    def _stale_query(self, current_versions: Dict[str, int]) -> Dict[str, Any]:
+        return {
+            "resume_text_z": {"$exists": True},
+            "$or": [
+                {f"extractor_versions.{field}": {"$ne": version}}
+                for field, version in current_versions.items()
+            ]
+        }
@@ -1,6 +1,9 @@
+import asyncio
 import os
 import requests
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, List
 from app.models.candidate import Candidate
 
 
@@ -14,62 +17,109 @@ class QAService:
         
         self.qa_model_url = "https://api-inference.huggingface.co/models/deepset/roberta-base-squad2"
         
+        self.batch_concurrency = int(os.getenv("ASK_BATCH_CONCURRENCY", "4"))
+        self.retry_concurrency = int(os.getenv("ASK_RETRY_CONCURRENCY", "4"))
+        self.executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("QA_MAX_WORKERS", "8")),
+            thread_name_prefix="qa-inference"
+        )
+        
         if not self.hf_api_key:
             print("Warning: HUGGINGFACE_API_KEY not set. Q&A endpoint will not work properly.")
     
     async def answer_question(self, question: str, candidate: Candidate) -> str:
         try:
             context = self._format_candidate_context(candidate)
-            
-            prompt = f"""Based on the following candidate information, answer the question.
-
-Candidate Information:
-{context}
-
-Question: {question}
-
-Answer:"""
-            
-            headers = {
-                "Authorization": f"Bearer {self.hf_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "inputs": {
-                    "question": question,
-                    "context": context
-                }
-            }
+            return await self._answer_with_context(question, context, self._headers())
+        
+        except Exception as e:
+            raise Exception(f"Error generating answer: {str(e)}")
+    
+    async def answer_questions(self, questions: List[str], candidate: Candidate) -> List[str]:
+        try:
+            context = self._format_candidate_context(candidate)
+            headers = self._headers()
             
             try:
-                response = requests.post(
-                    self.qa_model_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=30
+                response = await self._post_qa(
+                    [{"question": question, "context": context} for question in questions],
+                    headers,
+                    timeout=60
                 )
                 
                 if response.status_code == 200:
                     result = response.json()
-                    if isinstance(result, dict) and "answer" in result:
-                        return result["answer"]
-                    elif isinstance(result, list) and len(result) > 0:
-                        return result[0].get("answer", "Unable to generate answer.")
+                    if isinstance(result, dict):
+                        result = [result]
+                    if isinstance(result, list) and len(result) == len(questions):
+                        return [
+                            item.get("answer", "Unable to generate answer.") if isinstance(item, dict)
+                            else "Unable to generate answer."
+                            for item in result
+                        ]
                 
-                elif response.status_code == 503:
+                if response.status_code == 503:
                     print("Q&A model is loading, falling back to text generation...")
-                    return await self._fallback_answer(question, context, headers)
+                    answer = partial(self._fallback_answer, context=context, headers=headers)
                 else:
-                    print(f"Q&A model error: {response.status_code}, falling back...")
-                    return await self._fallback_answer(question, context, headers)
+                    print(f"Batch Q&A model error: {response.status_code}, asking questions individually...")
+                    answer = partial(self._answer_with_context, context=context, headers=headers)
             
             except Exception as e:
-                print(f"Error with Q&A model: {e}, using fallback...")
+                print(f"Error with batch Q&A model: {e}, asking questions individually...")
+                answer = partial(self._answer_with_context, context=context, headers=headers)
+            
+            semaphore = asyncio.Semaphore(self.retry_concurrency)
+            
+            async def answer_one(question: str) -> str:
+                async with semaphore:
+                    return await answer(question)
+            
+            return list(await asyncio.gather(*[answer_one(question) for question in questions]))
+        
+        except Exception as e:
+            raise Exception(f"Error generating answers: {str(e)}")
+    
+    async def _answer_with_context(self, question: str, context: str, headers: Dict) -> str:
+        try:
+            response = await self._post_qa(
+                {"question": question, "context": context},
+                headers,
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                result = response.json()
+                if isinstance(result, dict) and "answer" in result:
+                    return result["answer"]
+                elif isinstance(result, list) and len(result) > 0:
+                    return result[0].get("answer", "Unable to generate answer.")
+            
+            elif response.status_code == 503:
+                print("Q&A model is loading, falling back to text generation...")
+                return await self._fallback_answer(question, context, headers)
+            else:
+                print(f"Q&A model error: {response.status_code}, falling back...")
                 return await self._fallback_answer(question, context, headers)
         
         except Exception as e:
-            raise Exception(f"Error generating answer: {str(e)}")
+            print(f"Error with Q&A model: {e}, using fallback...")
+            return await self._fallback_answer(question, context, headers)
+    
+    async def _post_qa(self, inputs: Any, headers: Dict, timeout: int) -> requests.Response:
+        return await self._post(self.qa_model_url, headers, {"inputs": inputs}, timeout)
+    
+    async def _post(self, url: str, headers: Dict, payload: Dict, timeout: int) -> requests.Response:
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            partial(requests.post, url, headers=headers, json=payload, timeout=timeout)
+        )
+    
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.hf_api_key}",
+            "Content-Type": "application/json"
+        }
     
     async def _fallback_answer(self, question: str, context: str, headers: Dict) -> str:
         try:
@@ -79,12 +129,7 @@ Answer:"""
             
             payload = {"inputs": prompt, "parameters": {"max_length": 150, "temperature": 0.7}}
             
-            response = requests.post(
-                gen_model_url,
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
+            response = await self._post(gen_model_url, headers, payload, timeout=30)
             
             if response.status_code == 200:
                 result = response.json()
@@ -0,0 +1,115 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.services.mongodb_service import MongoDBService
+from app.services.resume_processor import ResumeProcessor, EXTRACTOR_VERSIONS, decompress_text, stale_fields
+
+
+_worker_processor: Optional[ResumeProcessor] = None
+
+
+def _init_worker():
+    global _worker_processor
+    _worker_processor = ResumeProcessor(load_models=False)
+
+
+def _reextract(candidate_id: str, resume_text_z: bytes, fields: List[str]) -> Tuple[str, Dict[str, Any]]:
+    resume_text = decompress_text(resume_text_z)
+    return candidate_id, _worker_processor.extract_fields(resume_text, fields)
+
+
+class ReprocessService:
+    def __init__(self, mongodb_service: MongoDBService):
+        self.mongodb_service = mongodb_service
+        self.max_workers = int(os.getenv("REPROCESS_WORKERS", str(os.cpu_count() or 1)))
+        self.batch_size = int(os.getenv("REPROCESS_BATCH_SIZE", "100"))
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._status: Dict[str, Any] = {"state": "idle"}
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> Dict[str, Any]:
+        if self._lock.locked() or self.is_running():
+            raise RuntimeError("Reprocessing is already running")
+
+        async with self._lock:
+            total = await self.mongodb_service.count_stale_candidates(EXTRACTOR_VERSIONS)
+            unreprocessable = await self.mongodb_service.count_unreprocessable_candidates()
+            self._status = {
+                "state": "running",
+                "extractor_versions": dict(EXTRACTOR_VERSIONS),
+                "total": total,
+                "unreprocessable": unreprocessable,
+                "processed": 0,
+                "updated": 0,
+                "failed": 0,
+                "started_at": time.time(),
+                "finished_at": None,
+                "error": None
+            }
+            self._task = asyncio.create_task(self._run())
+            return self.get_status()
+
+    def get_status(self) -> Dict[str, Any]:
+        status = dict(self._status)
+        if "started_at" in status:
+            end = status["finished_at"] or time.time()
+            elapsed = max(end - status["started_at"], 1e-6)
+            status["elapsed_seconds"] = round(elapsed, 2)
+            status["candidates_per_second"] = round(status["processed"] / elapsed, 2)
+            if status["total"]:
+                status["progress"] = round(status["processed"] / status["total"], 4)
+        return status
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+
+        try:
+            async for batch in self.mongodb_service.iter_stale_candidates(EXTRACTOR_VERSIONS, self.batch_size):
+                futures = []
+                for doc in batch:
+                    futures.append(loop.run_in_executor(
+                        executor,
+                        _reextract,
+                        doc["candidate_id"],
+                        doc["resume_text_z"],
+                        stale_fields(doc.get("extractor_versions"))
+                    ))
+
+                results = await asyncio.gather(*futures, return_exceptions=True)
+
+                updates = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        print(f"Reprocess error: {result}")
+                        self._status["failed"] += 1
+                    else:
+                        updates.append(result)
+
+                self._status["updated"] += await self.mongodb_service.update_extracted_fields(
+                    updates,
+                    EXTRACTOR_VERSIONS
+                )
+                self._status["processed"] += len(batch)
+
+            self._status["state"] = "completed"
+
+        except Exception as e:
+            print(f"Reprocessing failed: {e}")
+            self._status["state"] = "failed"
+            self._status["error"] = str(e)
+
+        finally:
+            await loop.run_in_executor(None, executor.shutdown)
+            self._status["finished_at"] = time.time()
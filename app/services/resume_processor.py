@@ -1,18 +1,51 @@
+import asyncio
 import os
 import re
-from typing import Dict, Any, List
+import zlib
+from typing import Dict, Any, List, Optional
 import PyPDF2
 import docx
 from io import BytesIO
-from transformers import pipeline
+
+
+EXTRACTOR_VERSIONS = {
+    "education": 1,
+    "experience": 1,
+    "skills": 1,
+    "hobbies": 1,
+    "certifications": 1,
+    "projects": 1,
+    "introduction": 1
+}
+
+
+def stale_fields(stored_versions: Optional[Dict[str, int]], current_versions: Dict[str, int] = EXTRACTOR_VERSIONS) -> List[str]:
+    stored_versions = stored_versions or {}
+    return [
+        field for field, version in current_versions.items()
+        if stored_versions.get(field) != version
+    ]
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def decompress_text(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
 
 
 class ResumeProcessor:
-    def __init__(self):
+    def __init__(self, load_models: bool = True):
         self.ner_model = None
         self.text_classifier = None
         
+        if not load_models:
+            return
+        
         try:
+            from transformers import pipeline
+            
             self.ner_model = pipeline(
                 "ner",
                 model="dbmdz/bert-large-cased-finetuned-conll03-english",
@@ -22,6 +55,9 @@ class ResumeProcessor:
             print(f"Warning: Could not load NER model: {e}. Using basic extraction.")
     
     async def extract_text(self, file_content: bytes, file_ext: str) -> str:
+        return await asyncio.to_thread(self._extract_text, file_content, file_ext)
+    
+    def _extract_text(self, file_content: bytes, file_ext: str) -> str:
         try:
             if file_ext == ".pdf":
                 pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
@@ -42,6 +78,9 @@ class ResumeProcessor:
             raise Exception(f"Error extracting text: {str(e)}")
     
     async def process_resume(self, resume_text: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._process_resume, resume_text)
+    
+    def _process_resume(self, resume_text: str) -> Dict[str, Any]:
         try:
             entities = []
             if self.ner_model:
@@ -53,21 +92,20 @@ class ResumeProcessor:
                 except Exception as e:
                     print(f"NER processing error: {e}")
             
-            candidate_data = {
-                "education": self._extract_education(resume_text),
-                "experience": self._extract_experience(resume_text),
-                "skills": self._extract_skills(resume_text),
-                "hobbies": self._extract_hobbies(resume_text),
-                "certifications": self._extract_certifications(resume_text),
-                "projects": self._extract_projects(resume_text),
-                "introduction": self._extract_introduction(resume_text)
-            }
+            candidate_data = self.extract_fields(resume_text)
+            candidate_data["extractor_versions"] = dict(EXTRACTOR_VERSIONS)
             
             return candidate_data
         
         except Exception as e:
             raise Exception(f"Error processing resume: {str(e)}")
     
+    def extract_fields(self, resume_text: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        if fields is None:
+            fields = list(EXTRACTOR_VERSIONS)
+        
+        return {field: getattr(self, f"_extract_{field}")(resume_text) for field in fields}
+    
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
         education = []
         
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from app.services.admission_controller import AdmissionController, AdmissionRejected
+
+
+def make_controller(max_concurrent: int, max_queue: int) -> AdmissionController:
+    controller = AdmissionController()
+    controller.max_concurrent = max_concurrent
+    controller.max_queue = max_queue
+    return controller
+
+
+async def hold(controller: AdmissionController, name: str, order: list, release: asyncio.Event):
+    async with controller.admit():
+        order.append(name)
+        await release.wait()
+
+
+def test_admits_up_to_max_concurrent_then_queues_in_order():
+    async def scenario():
+        controller = make_controller(max_concurrent=2, max_queue=5)
+        order = []
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(controller, name, order, release)) for name in "abcd"]
+        await asyncio.sleep(0)
+
+        assert order == ["a", "b"]
+        assert controller.get_stats()["active"] == 2
+        assert controller.get_stats()["queue_depth"] == 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "c", "d"]
+        stats = controller.get_stats()
+        assert stats["active"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["admitted"] == 4
+        assert stats["peak_queue_depth"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_rejects_when_queue_is_full():
+    async def scenario():
+        controller = make_controller(max_concurrent=1, max_queue=1)
+        controller.retry_after = 7
+        order = []
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(controller, name, order, release)) for name in "ab"]
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as excinfo:
+            async with controller.admit():
+                pass
+
+        assert excinfo.value.retry_after == 7
+        assert controller.get_stats()["rejected"] == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert order == ["a", "b"]
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_is_removed_from_queue():
+    async def scenario():
+        controller = make_controller(max_concurrent=1, max_queue=2)
+        order = []
+        release = asyncio.Event()
+        first = asyncio.create_task(hold(controller, "a", order, release))
+        cancelled = asyncio.create_task(hold(controller, "b", order, release))
+        last = asyncio.create_task(hold(controller, "c", order, release))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        assert controller.get_stats()["queue_depth"] == 1
+
+        release.set()
+        await asyncio.gather(first, last)
+
+        assert cancelled.cancelled()
+        assert order == ["a", "c"]
+        assert controller.get_stats()["active"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_slot_handed_to_cancelled_waiter_is_passed_on():
+    async def scenario():
+        controller = make_controller(max_concurrent=1, max_queue=2)
+        order = []
+        release = asyncio.Event()
+        release.set()
+        await controller._acquire()
+        cancelled = asyncio.create_task(hold(controller, "b", order, release))
+        last = asyncio.create_task(hold(controller, "c", order, release))
+        await asyncio.sleep(0)
+
+        # "b" is handed the slot and cancelled before it gets to resume
+        controller._release()
+        cancelled.cancel()
+        await asyncio.gather(last)
+
+        assert cancelled.cancelled()
+        assert order == ["c"]
+        assert controller.get_stats()["active"] == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("name, value", [
+    ("ADMISSION_MAX_CONCURRENT", "0"),
+    ("ADMISSION_MAX_CONCURRENT", "-1"),
+    ("ADMISSION_MAX_QUEUE", "-1"),
+    ("ADMISSION_RETRY_AFTER", "-5")
+])
+def test_rejects_invalid_configuration(monkeypatch, name, value):
+    monkeypatch.setenv(name, value)
+
+    with pytest.raises(ValueError, match=name):
+        AdmissionController()
+
+
+def test_zero_queue_rejects_as_soon_as_slots_are_full(monkeypatch):
+    monkeypatch.setenv("ADMISSION_MAX_CONCURRENT", "1")
+    monkeypatch.setenv("ADMISSION_MAX_QUEUE", "0")
+
+    async def scenario():
+        controller = AdmissionController()
+        async with controller.admit():
+            with pytest.raises(AdmissionRejected):
+                async with controller.admit():
+                    pass
+
+    asyncio.run(scenario())
@@ -0,0 +1,61 @@
+from app.services.facet_counts import facet_values, facet_deltas
+
+
+def test_facet_values_dedups_and_filters_invalid_entries():
+    doc = {
+        "skills": ["Python", "Python", "SQL", "", None],
+        "education": [
+            {"degree": "Bachelor of Science", "end_date": "2020"},
+            {"degree": "Bachelor of Science", "end_date": "May 2019"},
+            {"institution": "State University", "end_date": None}
+        ]
+    }
+
+    assert facet_values(doc) == {
+        "skill": {"Python", "SQL"},
+        "degree": {"Bachelor of Science"},
+        "year": {"2020"}
+    }
+
+
+def test_facet_values_handles_missing_document_and_fields():
+    empty = {"skill": set(), "degree": set(), "year": set()}
+
+    assert facet_values(None) == empty
+    assert facet_values({"skills": None}) == empty
+
+
+def test_new_candidate_increments_every_value():
+    new_doc = {"skills": ["Python"], "education": [{"degree": "MBA", "end_date": "2018"}]}
+
+    assert facet_deltas([(None, new_doc)]) == {
+        ("skill", "Python"): 1,
+        ("degree", "MBA"): 1,
+        ("year", "2018"): 1
+    }
+
+
+def test_update_only_counts_changed_values():
+    old_doc = {"skills": ["Python", "Java"], "education": [{"degree": "MBA", "end_date": "2018"}]}
+    new_doc = {"skills": ["Python", "Docker"], "education": [{"degree": "MBA", "end_date": "2018"}]}
+
+    assert facet_deltas([(old_doc, new_doc)]) == {
+        ("skill", "Docker"): 1,
+        ("skill", "Java"): -1
+    }
+
+
+def test_unchanged_candidate_produces_no_deltas():
+    doc = {"skills": ["Python"], "education": [{"degree": "MBA", "end_date": "2018"}]}
+
+    assert facet_deltas([(doc, dict(doc))]) == {}
+
+
+def test_deltas_are_summed_and_cancelling_deltas_dropped():
+    diffs = [
+        (None, {"skills": ["Python", "SQL"]}),
+        (None, {"skills": ["Python"]}),
+        ({"skills": ["SQL"]}, {"skills": []})
+    ]
+
+    assert facet_deltas(diffs) == {("skill", "Python"): 2}
@@ -0,0 +1,127 @@
+import asyncio
+
+from app.models.candidate import Candidate
+from app.services.qa_service import QAService
+
+
+QUESTIONS = ["Where did they study?", "What is their title?", "Which skills?"]
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+def make_service(monkeypatch, post_qa, fallback=None):
+    service = QAService()
+    service.retry_concurrency = 2
+    calls = []
+
+    async def fake_post_qa(inputs, headers, timeout):
+        calls.append(inputs)
+        return await post_qa(inputs)
+
+    async def fake_fallback(question, context, headers):
+        return f"fallback: {question}"
+
+    monkeypatch.setattr(service, "_post_qa", fake_post_qa)
+    monkeypatch.setattr(service, "_fallback_answer", fallback or fake_fallback)
+    return service, calls
+
+
+def answer(service, questions=QUESTIONS):
+    candidate = Candidate(candidate_id="c1", skills=["Python"], introduction="Backend engineer")
+    return asyncio.run(service.answer_questions(questions, candidate))
+
+
+def test_batched_answers_stay_aligned_with_questions(monkeypatch):
+    async def post_qa(inputs):
+        return FakeResponse(200, [{"answer": f"answer: {item['question']}"} for item in inputs])
+
+    service, calls = make_service(monkeypatch, post_qa)
+
+    assert answer(service) == [f"answer: {question}" for question in QUESTIONS]
+    assert len(calls) == 1
+    assert [item["question"] for item in calls[0]] == QUESTIONS
+
+
+def test_single_dict_response_is_normalised_to_a_list(monkeypatch):
+    async def post_qa(inputs):
+        return FakeResponse(200, {"answer": "MIT"})
+
+    service, _ = make_service(monkeypatch, post_qa)
+
+    assert answer(service, QUESTIONS[:1]) == ["MIT"]
+
+
+def test_non_dict_items_get_placeholder_answer(monkeypatch):
+    async def post_qa(inputs):
+        return FakeResponse(200, [{"answer": "MIT"}, "garbage", {}])
+
+    service, _ = make_service(monkeypatch, post_qa)
+
+    assert answer(service) == ["MIT", "Unable to generate answer.", "Unable to generate answer."]
+
+
+def test_length_mismatch_retries_each_question_individually(monkeypatch):
+    async def post_qa(inputs):
+        if isinstance(inputs, list):
+            return FakeResponse(200, [{"answer": "only one"}])
+        return FakeResponse(200, {"answer": f"single: {inputs['question']}"})
+
+    service, calls = make_service(monkeypatch, post_qa)
+
+    assert answer(service) == [f"single: {question}" for question in QUESTIONS]
+    assert len(calls) == 1 + len(QUESTIONS)
+
+
+def test_batch_error_retries_individually_then_falls_back(monkeypatch):
+    async def post_qa(inputs):
+        if isinstance(inputs, list):
+            raise ConnectionError("boom")
+        if inputs["question"] == QUESTIONS[1]:
+            return FakeResponse(500)
+        return FakeResponse(200, {"answer": f"single: {inputs['question']}"})
+
+    service, _ = make_service(monkeypatch, post_qa)
+
+    assert answer(service) == [
+        f"single: {QUESTIONS[0]}",
+        f"fallback: {QUESTIONS[1]}",
+        f"single: {QUESTIONS[2]}"
+    ]
+
+
+def test_model_loading_goes_straight_to_fallback(monkeypatch):
+    async def post_qa(inputs):
+        return FakeResponse(503)
+
+    service, calls = make_service(monkeypatch, post_qa)
+
+    assert answer(service) == [f"fallback: {question}" for question in QUESTIONS]
+    assert len(calls) == 1
+
+
+def test_individual_retries_are_bounded(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def post_qa(inputs):
+        nonlocal in_flight, peak
+        if isinstance(inputs, list):
+            return FakeResponse(500)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return FakeResponse(200, {"answer": inputs["question"]})
+
+    service, _ = make_service(monkeypatch, post_qa)
+    questions = [f"question {i}" for i in range(6)]
+
+    assert answer(service, questions) == questions
+    assert peak == service.retry_concurrency
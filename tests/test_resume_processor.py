@@ -0,0 +1,63 @@
+from app.services.resume_processor import (
+    EXTRACTOR_VERSIONS,
+    ResumeProcessor,
+    compress_text,
+    decompress_text,
+    stale_fields
+)
+
+
+RESUME_TEXT = """Jane Doe
+Backend engineer
+
+SKILLS
+Python, SQL, Docker
+
+HOBBIES
+Chess, Hiking
+"""
+
+
+def test_stale_fields_lists_every_field_without_stored_versions():
+    assert stale_fields(None) == list(EXTRACTOR_VERSIONS)
+    assert stale_fields({}) == list(EXTRACTOR_VERSIONS)
+
+
+def test_stale_fields_is_empty_when_versions_match():
+    assert stale_fields(dict(EXTRACTOR_VERSIONS)) == []
+
+
+def test_stale_fields_returns_only_changed_extractors():
+    current = {"skills": 2, "hobbies": 1, "introduction": 3}
+    stored = {"skills": 1, "hobbies": 1}
+
+    assert stale_fields(stored, current) == ["skills", "introduction"]
+
+
+def test_compress_text_round_trip():
+    text = RESUME_TEXT + "Zoë — naïve café résumé\n" * 50
+
+    compressed = compress_text(text)
+
+    assert isinstance(compressed, bytes)
+    assert len(compressed) < len(text.encode("utf-8"))
+    assert decompress_text(compressed) == text
+
+
+def test_extract_fields_runs_only_requested_extractors():
+    processor = ResumeProcessor(load_models=False)
+
+    result = processor.extract_fields(RESUME_TEXT, ["skills", "hobbies"])
+
+    assert set(result) == {"skills", "hobbies"}
+    assert {"Python", "SQL", "Docker"} <= set(result["skills"])
+    assert result["hobbies"] == processor._extract_hobbies(RESUME_TEXT)
+
+
+def test_extract_fields_defaults_to_every_extractor():
+    processor = ResumeProcessor(load_models=False)
+
+    result = processor.extract_fields(RESUME_TEXT)
+
+    assert list(result) == list(EXTRACTOR_VERSIONS)
+    assert result["skills"] == processor._extract_skills(RESUME_TEXT)